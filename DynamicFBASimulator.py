@@ -1,7 +1,106 @@
+import cobra
 from cobra.io.web import load_model
-from typing import Dict, List, Optional, Tuple 
+from cobra.util.solver import solvers
+import optlang
+from optlang.interface import Variable
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple 
+import math 
+import os 
+import pickle 
+import numpy as np 
+from scipy.integrate import LSODA
 import time 
 
+try: 
+    # Ahead-of-time compiled kernels, built with `python _kernels.py` 
+    from _kernels_aot import compute_bounds, euler_update, inhibition
+except ImportError: 
+    from _kernels import compute_bounds, euler_update, inhibition
+
+# Preference order for solver='auto'. 'hybrid' is cobra's HiGHS interface. 
+SOLVER_PREFERENCE = ('gurobi', 'cplex', 'hybrid', 'glpk')
+# Set DFBA_MODEL_CACHE=0 to disable the model cache, or DFBA_MODEL_CACHE_DIR to move it 
+MODEL_CACHE_DIR = os.environ.get('DFBA_MODEL_CACHE_DIR', os.path.expanduser('~/.cache/dfba'))
+
+def _load_glpk_model(model_name: str): 
+    '''
+    Load a COBRA model and switch it to GLPK. 
+    '''
+    model = load_model(model_name)
+    model.solver = 'glpk'
+    return model 
+
+def _load_model_cached(model_name: str, use_cache: bool = True): 
+    '''
+    Load a COBRA model, caching it as a pickle in MODEL_CACHE_DIR. 
+    Unpickling is much faster than fetching and parsing SBML on every run. 
+
+    The model is always returned GLPK-backed (cached or not), since a GLPK model 
+    round-trips through pickle exactly. DynamicFBASimulator then builds the 
+    requested solver from it in _select_solver, so that cached and uncached runs 
+    solve the same LP. The cache file name includes the cobra and optlang versions, 
+    so upgrading either starts a fresh cache. A pickle that cannot be loaded, 
+    or that is not GLPK-backed, is replaced by a fresh load. 
+    '''
+    if not use_cache or os.environ.get('DFBA_MODEL_CACHE') == '0': 
+        return _load_glpk_model(model_name)
+    cache_path = os.path.join(MODEL_CACHE_DIR, 
+        f'{model_name}.glpk.cobra{cobra.__version__}.optlang{optlang.__version__}.pkl')
+    if os.path.exists(cache_path): 
+        try: 
+            with open(cache_path, 'rb') as f: 
+                model = pickle.load(f)
+            if model.solver.interface.__name__ == 'optlang.glpk_interface': 
+                return model 
+            print(f'Ignoring model cache {cache_path} that is not GLPK-backed, reloading {model_name}.')
+        except Exception as e: 
+            print(f'Ignoring unreadable model cache {cache_path} ({e!r}), reloading {model_name}.')
+    model = _load_glpk_model(model_name)
+    os.makedirs(MODEL_CACHE_DIR, exist_ok=True)
+    # Write to a temporary file first, so parallel runs never read a partial pickle 
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f: 
+        pickle.dump(model, f, protocol=5)
+    os.replace(tmp_path, cache_path)
+    return model 
+
+class _ConcView(Mapping): 
+    '''
+    Dict-like view of extracellular concentrations, backed by a NumPy array. 
+    The simulator updates the array in place; reads and writes through this view 
+    see and change the same values. Metabolites cannot be added or removed. 
+    '''
+    def __init__(self, idx: Dict[str, int], arr: np.ndarray): 
+        self._idx = idx 
+        self._arr = arr 
+
+    def __getitem__(self, mid: str) -> float: 
+        return float(self._arr[self._idx[mid]])
+
+    def __setitem__(self, mid: str, value: float) -> None: 
+        self._arr[self._idx[mid]] = value 
+
+    def update(self, values: Mapping) -> None: 
+        '''
+        Set several concentrations at once. Raises KeyError, without writing 
+        anything, if values contains a metabolite that is not tracked. 
+        '''
+        unknown = [mid for mid in values if mid not in self._idx]
+        if unknown: 
+            raise KeyError(f'{unknown} not found in external concentrations.')
+        for mid, value in values.items(): 
+            self._arr[self._idx[mid]] = value 
+
+    def __iter__(self) -> Iterator[str]: 
+        return iter(self._idx)
+
+    def __len__(self) -> int: 
+        return len(self._idx)
+
+    def __repr__(self) -> str: 
+        return repr(dict(self.items()))
+
 class DynamicFBASimulator: 
     '''
     Simulator for dynamic FBA (Flux Balance Analysis). 
@@ -29,8 +128,14 @@ class DynamicFBASimulator:
         setpoints: Optional[Dict[str, float]] = None, # Metabolite ID -> External concentration (mM)
         essential_exchanges: Optional[List[str]] = None, 
         clip_negative: bool = True, # If True, clip negative concentrations to zero 
+        record_every: int = 1, # Record results every record_every timesteps 
+        lp_skip_tol: float = 0.0, # Reuse last FBA fluxes if uptake bounds changed by less than this (relative) 
+        bound_eps: float = 0.0, # Only write uptake bounds to the solver that changed by more than this 
+        solver: str = 'auto', # LP solver name, or 'auto' for the first usable one in SOLVER_PREFERENCE 
+        cache_model: bool = True, # If True, cache the loaded model as a pickle in MODEL_CACHE_DIR 
     ): 
-        self.model = load_model(model_name)
+        self.model = _load_model_cached(model_name, use_cache=cache_model)
+        self._select_solver(solver)
         self.dt = dt 
         self.dt_hr = self.dt / 3600.0 
         self.volume = volume
@@ -39,7 +144,7 @@ class DynamicFBASimulator:
         self.vmax_params = vmax_params or {}
         self.km_params = km_params or {}
         self.kn_params = kn_params or {}
-        self.ext_conc = ext_conc or {}
+        self._ext_conc = ext_conc or {}
         self.setpoints = setpoints or {}
         self._init_missing_metabolites()
         self._check_setpoint_keys()
@@ -51,9 +156,82 @@ class DynamicFBASimulator:
                     "EX_k_e","EX_na1_e","EX_cl_e","EX_mg2_e","EX_ca2_e","EX_fe2_e"]
         self._apply_essential_bounds()
         self.BIOMASS_RXN = biomass_reaction_id
-        self.results = self._init_timeseries()
+        # Cache reaction objects read after every LP solve 
+        self._biomass_rxn = self.model.reactions.get_by_id(self.BIOMASS_RXN)
+        self._tracked_ex_rxns = [self.model.reactions.get_by_id(rid) for rid in self.exchange_reactions_map.values()]
+        self._ex_solver_vars = self._init_exchange_solver_vars()
+        self._configure_warm_start()
+        self._init_kinetic_arrays()
+        self._init_bound_writer()
+        self._init_timeseries()
         self.solution_feasible = True
         self.clip_negative = clip_negative
+        if record_every < 1: 
+            raise ValueError(f'record_every must be a positive integer, got {record_every}.')
+        self._record_every = record_every
+        self.lp_skip_tol = lp_skip_tol
+        self.bound_eps = bound_eps
+        # Uptake bounds, growth rate and exchange fluxes from the last LP solve 
+        self._last_uptake = None 
+        self._last_mu = 0.0 
+        self.n_lp_solves = 0 
+
+    @property
+    def ext_conc(self) -> Mapping: 
+        '''
+        External concentrations (mM), keyed by metabolite ID. After initialization 
+        this is a view of self._conc_arr, so reads and writes act on simulator state. 
+        '''
+        return self._ext_conc 
+
+    @ext_conc.setter
+    def ext_conc(self, values: Mapping) -> None: 
+        '''
+        Assigning a mapping updates the given concentrations in place, rather than 
+        replacing the view, so the simulation picks up the new values. 
+        '''
+        self._ext_conc.update(values)
+
+    def _select_solver(self, solver: str) -> None: 
+        '''
+        Set the LP solver and tune it for many small, repeated solves: 
+        presolve off (its overhead exceeds the solve time), and primal simplex 
+        where supported, to make the most of warm starts from the previous basis. 
+
+        For solver='auto', each installed solver in SOLVER_PREFERENCE is tried with 
+        a test solve, falling back to the next one on a solver or license error 
+        (e.g. a size-limited Gurobi license on a genome-scale model). 
+        '''
+        if solver != 'auto': 
+            self._set_solver(solver)
+            return 
+        candidates = [name for name in SOLVER_PREFERENCE if name in solvers]
+        for i, name in enumerate(candidates): 
+            try: 
+                # Test solve on a throwaway copy, so the model's own LP is built 
+                # (and warm-started) exactly as for an explicitly chosen solver 
+                solvers[name].Model.clone(self.model.solver).optimize()
+            except Exception as e: 
+                if i == len(candidates) - 1: 
+                    raise 
+                print(f'Solver {name} unusable for this model ({e!r}), trying {candidates[i + 1]}.')
+                continue 
+            self._set_solver(name)
+            return 
+        raise ValueError(f'No LP solver available, install one of {SOLVER_PREFERENCE}.')
+
+    def _set_solver(self, solver: str) -> None: 
+        '''
+        Switch the model to the named solver and apply the repeated-solve tuning. 
+        '''
+        self.model.solver = solver
+        configuration = self.model.solver.configuration
+        configuration.presolve = False 
+        if hasattr(configuration, 'lp_method'): 
+            try: 
+                configuration.lp_method = 'primal'
+            except ValueError: 
+                pass 
 
     def _init_missing_metabolites(self) -> None: 
         '''
@@ -61,10 +239,10 @@ class DynamicFBASimulator:
         are not tracked in ext_conc, set that initial 
         value to zero. 
         '''
-        for rxn in self.model.exchanges: 
-            for metabolite in rxn.metabolites: 
-                if metabolite.id not in self.ext_conc: 
-                    self.ext_conc[metabolite.id] = 0.0 
+        # dict.fromkeys keeps first-seen order, so results columns stay deterministic 
+        exchange_mids = dict.fromkeys(m.id for rxn in self.model.exchanges for m in rxn.metabolites)
+        missing = [m for m in exchange_mids if m not in self.ext_conc]
+        self.ext_conc.update(dict.fromkeys(missing, 0.0))
 
     def _check_setpoint_keys(self) -> None: 
         '''
@@ -81,24 +259,55 @@ class DynamicFBASimulator:
         metabolite IDs, and values are reaction IDs,
         for all exchange reactions. 
         '''
-        ex_reactions_map = {}
-        for reaction in self.model.exchanges: 
-            metabolites = list(reaction.metabolites.keys())
-            if len(metabolites) == 1: 
-                if metabolites[0].compartment == 'e': 
-                    ex_reactions_map[metabolites[0].id] = reaction.id 
-        return ex_reactions_map
+        return {
+            metabolite.id: reaction.id 
+            for reaction in self.model.exchanges 
+            if len(reaction.metabolites) == 1 
+            for metabolite in reaction.metabolites 
+            if metabolite.compartment == 'e' 
+        }
 
-    def _init_timeseries(self) -> Dict[str, List[float]]: 
+    def _init_timeseries(self, n_rows: int = 0) -> None: 
         '''
-        Initialize results dictionary 
+        Initialize preallocated results array 
         for tracking time series of simulation results. 
+        Columns are time, biomass, then metabolites in ext_conc order. 
         '''
-        return { 
-            'time_s': [], 
-            'biomass_gDW': [], 
-            **{m: [] for m in self.ext_conc.keys()}, # track metabolites per time step 
-        }
+        self._results_columns = ['time_s', 'biomass_gDW', *self._ext_mid_list]
+        self._results_arr = np.empty((n_rows, len(self._results_columns)), dtype=np.float64)
+        self._n_recorded = 0 
+
+    def _reserve_timeseries(self, n_rows: int) -> None: 
+        '''
+        Grow the results array so that it holds at least n_rows more rows. 
+        '''
+        needed = self._n_recorded + n_rows 
+        if needed > self._results_arr.shape[0]: 
+            grown = np.empty((needed, self._results_arr.shape[1]), dtype=np.float64)
+            grown[:self._n_recorded] = self._results_arr[:self._n_recorded]
+            self._results_arr = grown 
+
+    @property
+    def results_columns(self) -> List[str]: 
+        '''
+        Column names of results_array. 
+        '''
+        return self._results_columns
+
+    @property
+    def results_array(self) -> np.ndarray: 
+        '''
+        Recorded time series as a (n_recorded, 2 + n_metabolites) array. 
+        '''
+        return self._results_arr[:self._n_recorded]
+
+    @property
+    def results(self) -> Dict[str, np.ndarray]: 
+        '''
+        Recorded time series keyed by column name. 
+        '''
+        arr = self.results_array
+        return {name: arr[:, j] for j, name in enumerate(self._results_columns)}
 
     def _apply_essential_bounds(self) -> None: 
         '''
@@ -113,61 +322,155 @@ class DynamicFBASimulator:
             except KeyError: 
                 pass 
 
-    def _set_dynamic_bounds(self) -> float: 
+    def _init_exchange_solver_vars(self) -> Dict[str, Variable]: 
+        '''
+        Cache the solver variables that carry uptake for each exchange reaction. 
+
+        Cobra splits a reaction into forward and reverse variables, with 
+        flux = forward - reverse. For lower_bound <= 0 <= upper_bound, cobra sets 
+        the reverse variable bounds to [0, -lower_bound]. Exchange lower bounds are 
+        pinned to zero once here via cobra, so each step only has to write the 
+        reverse variable's upper bound directly, skipping the cobra setter. 
+        Note that reaction.lower_bound will not reflect the dynamic bounds. 
+        '''
+        ex_solver_vars = {}
+        for rxn in self._tracked_ex_rxns: 
+            rxn.lower_bound = 0.0 
+            ex_solver_vars[rxn.id] = rxn.reverse_variable
+        return ex_solver_vars
+
+    def _init_kinetic_arrays(self) -> None: 
+        '''
+        Build NumPy arrays aligned with the exchange reactions map, so that 
+        Michaelis-Menten bounds are computed in one vectorized pass per step. 
+        self._conc_arr holds every metabolite in ext_conc, in ext_conc key order; 
+        self._ex_conc_idx maps each exchange metabolite to its position in it. 
+        '''
+        self._ext_mid_list = list(self.ext_conc.keys())
+        ext_conc_index = {mid: i for i, mid in enumerate(self._ext_mid_list)}
+        self._conc_arr = np.array([self.ext_conc[m] for m in self._ext_mid_list], dtype=np.float64)
+        # From here on, ext_conc is a view of self._conc_arr 
+        self._ext_conc = _ConcView(ext_conc_index, self._conc_arr)
+
+        self._ex_mids = list(self.exchange_reactions_map.keys())
+        self._ex_rids = list(self.exchange_reactions_map.values())
+        self._ex_conc_idx = np.array([ext_conc_index[m] for m in self._ex_mids], dtype=np.int64)
+        self._ex_var_list = [self._ex_solver_vars[rid] for rid in self._ex_rids]
+        self._ex_fwd_vars = [rxn.forward_variable for rxn in self._tracked_ex_rxns]
+        self._vmax_arr = np.array([self.vmax_params.get(rid, 10.0) for rid in self._ex_rids], dtype=np.float64) # Default Vmax of 10
+        self._km_arr = np.array([self.km_params.get(rid, 0.01) for rid in self._ex_rids], dtype=np.float64) # Default Km of 0.01
+        self._setpoint_mask = np.array([m in self.setpoints for m in self._ex_mids], dtype=np.bool_)
+        # Only non-setpoint exchange metabolites change during a step 
+        self._dynamic_conc_idx = self._ex_conc_idx[~self._setpoint_mask]
+        # Preallocated per-step buffers for the kernels 
+        self._uptake_buf = np.empty(len(self._ex_rids), dtype=np.float64)
+        self._flux_buf = np.empty(len(self._ex_rids), dtype=np.float64)
+
+        # Inhibition table: one (concentration index, Kn) row per extracellular 
+        # metabolite of each inhibitory reaction in self.kn_params 
+        inhib_table = [
+            (ext_conc_index[m.id], kn_value)
+            for rid, kn_value in self.kn_params.items()
+            for m in self.model.reactions.get_by_id(rid).metabolites
+            if m.id.endswith('_e') and m.id in ext_conc_index
+        ]
+        self._inhib_conc_idx = np.array([row[0] for row in inhib_table], dtype=np.int64)
+        self._inhib_kn = np.array([row[1] for row in inhib_table], dtype=np.float64)
+
+    def _configure_warm_start(self) -> None: 
+        '''
+        Ask the LP solver to reuse the previous basis between steps. 
+        GLPK keeps its basis between solves by default; Gurobi needs LPWarmStart. 
+        '''
+        if self.model.solver.interface.__name__ == 'optlang.gurobi_interface': 
+            self.model.solver.problem.setParam('LPWarmStart', 2)
+
+    def _init_bound_writer(self) -> None: 
+        '''
+        For Gurobi, cache the native variables behind the exchange reverse variables, 
+        so all uptake bounds are written with one setAttr call per step. 
+        Other interfaces apply optlang bound changes immediately, one variable at a time. 
+        '''
+        self._grb_rev_vars = None 
+        self._batch_bounds = False # True only while run() is executing on Gurobi 
+        self._optlang_stale = np.zeros(len(self._ex_var_list), dtype=np.bool_)
+        if self.model.solver.interface.__name__ == 'optlang.gurobi_interface': 
+            problem = self.model.solver.problem
+            problem.update()
+            self._grb_rev_vars = [problem.getVarByName(var.name) for var in self._ex_var_list]
+
+    def _write_uptake_bounds(self, positions: np.ndarray, ubs: List[float]) -> None: 
+        '''
+        Write upper bounds for the exchange reverse variables at the given 
+        positions in the exchange map. 
+        Inside run() on Gurobi, bounds are written natively in one setAttr call, 
+        bypassing optlang; the positions are marked stale and re-synced through 
+        optlang by _sync_optlang_bounds when run() returns. 
+        '''
+        if self._batch_bounds: 
+            if positions.size: 
+                grb_vars = [self._grb_rev_vars[i] for i in positions.tolist()]
+                self.model.solver.problem.setAttr('UB', grb_vars, ubs)
+                self._optlang_stale[positions] = True 
+            return 
+        for i, ub in zip(positions.tolist(), ubs): 
+            self._ex_var_list[i].set_bounds(lb=0.0, ub=ub)
+
+    def _sync_optlang_bounds(self) -> None: 
+        '''
+        Push bounds written natively during run() back through optlang, so that 
+        optlang's cached Variable.ub matches the solver again. Anything rebuilding 
+        the LP from optlang state (model.copy(), switching model.solver) then sees 
+        the current uptake bounds. 
+        '''
+        for i in np.flatnonzero(self._optlang_stale).tolist(): 
+            self._ex_var_list[i].set_bounds(lb=0.0, ub=-float(self._last_uptake[i]))
+        self._optlang_stale[:] = False 
+
+    def _set_dynamic_bounds(self) -> Tuple[float, bool]: 
         '''
         1. Update exchange bounds based on external concentrations. 
         The formula is based on Michaelis-Menten kinetics. 
+        Bounds are only written to the solver when some uptake bound moved by at 
+        least self.lp_skip_tol (relative) since the last LP solve. 
         2. Compute a multiplicative biomass inhibition factor based on 
         concentration of inhibitory products, which are specified in 
         self.kn_params. 
-        '''
-        # 1. Compute update limits and udate reaction lower bounds accordingly 
-        for metabolite_id, reaction_id in self.exchange_reactions_map.items(): 
-            if metabolite_id not in self.ext_conc: 
-                continue 
-            reaction_current = self.model.reactions.get_by_id(reaction_id)
-            conc = max(self.ext_conc[metabolite_id], 0.0)
-            V_max = self.vmax_params.get(reaction_id, 10.0) # Default Vmax of 10
-            Km = self.km_params.get(reaction_id, 0.01) # Default Km of 0.01 
 
-            # Michaelis-Menten uptake lower bound 
-            uptake_limit = 0.0 
-            if conc > 0: 
-                uptake_limit = -1.0 * V_max * conc / (Km + conc)
+        Returns the inhibition factor, and whether the LP must be re-solved. 
+        '''
+        # 1. Compute Michaelis-Menten uptake lower bounds for all exchanges at once 
+        conc = self._conc_arr[self._ex_conc_idx]
+        uptake = compute_bounds(conc, self._vmax_arr, self._km_arr, self._uptake_buf)
 
-            reaction_current.lower_bound = uptake_limit 
+        resolve = self._last_uptake is None or not (
+            np.max(np.abs(uptake - self._last_uptake) / (np.abs(self._last_uptake) + 1e-12)) < self.lp_skip_tol
+        )
+        if resolve: 
+            # Only push bounds that moved by more than self.bound_eps since last written 
+            if self._last_uptake is None: 
+                changed = np.arange(uptake.size)
+                self._last_uptake = uptake.copy()
+            else: 
+                changed = np.flatnonzero(np.abs(uptake - self._last_uptake) > self.bound_eps)
+                self._last_uptake[changed] = uptake[changed]
+            # Reverse variable upper bound is the negated reaction lower bound 
+            self._write_uptake_bounds(changed, (-uptake[changed]).tolist())
 
         # 2. Compute inhibitory factors for biomass creation 
-        biomass_inhibition_product_term = 1.0 
-        for reaction_id, kn_value in self.kn_params.items(): 
-            rxn_current = self.model.reactions.get_by_id(reaction_id)
-            for metabolite in rxn_current.metabolites: 
-                metabolite_id = metabolite.id 
-                if metabolite_id.endswith('_e') and metabolite_id in self.ext_conc: 
-                    conc = max(self.ext_conc[metabolite.id], 0.0)
-                    if conc > 0: 
-                        inhibitory_factor = kn_value / (kn_value + conc)
-                        biomass_inhibition_product_term *= inhibitory_factor
-        return biomass_inhibition_product_term
-
-    def _update_concentrations(self, fba_soln) -> None: 
+        return inhibition(self._conc_arr, self._inhib_kn, self._inhib_conc_idx), resolve
+
+    def _update_concentrations(self, fluxes: np.ndarray) -> None: 
         '''
         Euler update for all extracellular concentrations. 
 
-        fba_soln: Solution for FBA, keyed by metabolites. 
+        fluxes: Exchange fluxes from the last FBA solution, aligned with 
+        the exchange reactions map. 
         '''
-        for metabolite_id, reaction_id in self.exchange_reactions_map.items(): 
-            # Only update concentrations for metabolites that are NOT
-            # maintained at a setpoint value, AND are present in self.ext_conc. 
-            if metabolite_id not in self.ext_conc or metabolite_id in self.setpoints: 
-                continue 
-            flux = fba_soln.fluxes[reaction_id] 
-            # Note that Cobra fluxes are in 1/hr, not 1/s units. 
-            delta = flux * self.biomass * self.dt_hr / self.volume 
-            self.ext_conc[metabolite_id] += delta 
-            # Clip to zero if needed 
-            if self.clip_negative and self.ext_conc[metabolite_id] < 0: 
-                self.ext_conc[metabolite_id] = 0.0 
+        # Note that Cobra fluxes are in 1/hr, not 1/s units. 
+        # Metabolites maintained at a setpoint value are not updated. 
+        euler_update(self._conc_arr, self._ex_conc_idx, fluxes, self.biomass, 
+            self.dt_hr, self.volume, self.clip_negative, self._setpoint_mask)
             
     def _update_biomass(self, 
         mu: float, 
@@ -184,53 +487,186 @@ class DynamicFBASimulator:
         # NOTE: Biomass is in gDW, no need to normalize by volume. 
         self.biomass += mu * inhibition_term * self.biomass * self.dt_hr 
 
+    def _solve_fba(self, t: float) -> bool: 
+        '''
+        Solve the FBA instance with the current exchange bounds and cache 
+        the growth rate and exchange fluxes. Returns False if infeasible. 
+        '''
+        # slim_optimize skips building a full cobra Solution, 
+        # since only the biomass and exchange fluxes are needed. 
+        self.model.slim_optimize(error_value=float("nan"))
+        self.n_lp_solves += 1 
+        status = self.model.solver.status
+        if status != 'optimal': 
+            print(f'Solver status at time {t} is {status}. Expected "optimal".')
+            self.solution_feasible = False
+            return False 
+
+        self._last_mu = float(self._biomass_rxn.flux) # In 1/hr units 
+        # flux = forward - reverse primal, as in Reaction.flux, minus its per-call status check 
+        self._flux_buf[:] = np.fromiter(
+            (fwd.primal - rev.primal for fwd, rev in zip(self._ex_fwd_vars, self._ex_var_list)), 
+            dtype=np.float64, count=self._flux_buf.size)
+        return True 
+
     def step(self, t: int) -> Tuple[float, float]:
         '''
         Compute single timestep of dynamic FBA. 
         ''' 
         # get inhibitory effects, apply dynamic exchange bounds 
-        biomass_inhibition_product_term = self._set_dynamic_bounds()
-
-        # solve for the model 
-        sol = self.model.optimize()
-        if sol.status.lower() != 'optimal': 
-            print(f'Solver status at time {t} is {sol.status}. Expected "optimal".')
-            self.solution_feasible = False
+        biomass_inhibition_product_term, resolve = self._set_dynamic_bounds()
 
-        mu = float(sol.fluxes[self.BIOMASS_RXN]) # In 1/hr units 
+        if resolve and not self._solve_fba(t): 
+            return 0.0, biomass_inhibition_product_term
+        # Otherwise bounds are essentially unchanged, reuse the last FBA solution 
+        mu = self._last_mu 
 
-        self._update_concentrations(sol)
+        self._update_concentrations(self._flux_buf)
         self._update_biomass(mu, biomass_inhibition_product_term)
 
         # Record results 
-        self.results['time_s'].append(self.dt * t)
-        self.results['biomass_gDW'].append(self.biomass)
-        for m in self.ext_conc: 
-            self.results[m].append(self.ext_conc[m])
+        if t % self._record_every == 0: 
+            self._record(t)
 
         return mu, biomass_inhibition_product_term
     
-    def run(self, n_steps: int, verbose: bool = False) -> None:
+    def _record(self, t: int) -> None: 
+        '''
+        Write time, biomass and concentrations into the next results row. 
+        The row is labelled dt * t but holds the state after step t, i.e. at (t + 1) * dt. 
+        '''
+        if self._n_recorded == self._results_arr.shape[0]: 
+            # step() called outside run(), grow geometrically 
+            self._reserve_timeseries(max(self._n_recorded, 1))
+        row = self._results_arr[self._n_recorded]
+        row[0] = self.dt * t 
+        row[1] = self.biomass 
+        row[2:] = self._conc_arr 
+        self._n_recorded += 1 
+
+    def _dydt(self, t_hr: float, y: np.ndarray) -> np.ndarray: 
+        '''
+        Right-hand side for adaptive integration, with state y = [biomass, concentrations] 
+        and time in hours. FBA is re-solved only when the uptake bounds drift by more 
+        than self.lp_skip_tol, otherwise the last fluxes are reused. 
+            dX / dt = mu * inhibition_term * X 
+            dC / dt = flux * X / volume (zero for setpoint metabolites) 
+        '''
+        dydt = np.zeros_like(y)
+        if not self.solution_feasible: 
+            return dydt 
+        self._conc_arr[:] = y[1:]
+        inhibition_term, resolve = self._set_dynamic_bounds()
+        if not (0.0 <= inhibition_term and inhibition_term <= 1.0): 
+            raise ValueError(f'Biomass inhibition term {inhibition_term} should be in [0, 1].')
+        if resolve and not self._solve_fba(t_hr * 3600.0): 
+            return dydt 
+
+        biomass = y[0]
+        dydt[0] = self._last_mu * inhibition_term * biomass 
+        dydt[1 + self._dynamic_conc_idx] = self._flux_buf[~self._setpoint_mask] * biomass / self.volume 
+        return dydt 
+
+    def _run_adaptive(self, n_steps: int, rtol: float, atol: float) -> None: 
+        '''
+        Integrate over n_steps * dt seconds with scipy's LSODA, one solver step 
+        at a time, recording on the same grid as the fixed-step path: the row for 
+        step t (every record_every steps) holds the state at (t + 1) * dt. 
+        Stops at the last accepted state if an FBA solve turns infeasible. 
+        '''
+        record_steps = np.arange(0, n_steps, self._record_every)
+        t_record_hr = (record_steps + 1) * self.dt_hr 
+        t_end_hr = n_steps * self.dt_hr 
+        y0 = np.concatenate(([self.biomass], self._conc_arr))
+        self._reserve_timeseries(record_steps.size)
+
+        solver = LSODA(self._dydt, 0.0, y0, t_end_hr, rtol=rtol, atol=atol)
+        t_last, y_last = solver.t, y0.copy()
+        n_done = 0 # record points written so far 
+        while self.solution_feasible and solver.status == 'running': 
+            message = solver.step()
+            if not self.solution_feasible: 
+                # step rejected: an FBA solve inside it was infeasible 
+                break 
+            if solver.status == 'failed': 
+                raise RuntimeError(f'Adaptive integration failed at {solver.t:.6f} hours: {message}')
+            # Record all grid points covered by this step 
+            n_reached = np.searchsorted(t_record_hr, solver.t, side='right')
+            if n_reached > n_done: 
+                y_rows = solver.dense_output()(t_record_hr[n_done:n_reached]).T 
+                if self.clip_negative: 
+                    y_rows = np.maximum(y_rows, 0.0)
+                rows = self._results_arr[self._n_recorded:self._n_recorded + len(y_rows)]
+                rows[:, 0] = self.dt * record_steps[n_done:n_reached]
+                rows[:, 1:] = y_rows 
+                self._n_recorded += len(y_rows)
+                n_done = n_reached 
+            t_last, y_last = solver.t, solver.y.copy()
+
+        # Final state is the last accepted state, not the last trial evaluation 
+        if self.clip_negative: 
+            y_last = np.maximum(y_last, 0.0)
+        self.biomass = float(y_last[0])
+        self._conc_arr[:] = y_last[1:]
+        if not self.solution_feasible: 
+            print(f'Adaptive integration halted at {t_last:.6f} hours.')
+
+    def run(self, n_steps: int, verbose: bool = False, use_adaptive: bool = False, 
+        rtol: float = 1e-4, atol: float = 1e-6) -> None:
         '''
         Run dynamic FBA simulation for n_steps steps. 
+
+        use_adaptive: If True, integrate the same time span (n_steps * dt) with an 
+        adaptive LSODA solver instead of forward Euler, using rtol and atol. 
+        Setting lp_skip_tol > 0 additionally lets the solver reuse FBA fluxes 
+        between right-hand side evaluations. 
+        ''' 
+        # Batch native bound writes during the run, and re-sync optlang afterwards 
+        self._batch_bounds = self._grb_rev_vars is not None 
+        try: 
+            self._run(n_steps, verbose, use_adaptive, rtol, atol)
+        finally: 
+            self._batch_bounds = False 
+            self._sync_optlang_bounds()
+
+    def _run(self, n_steps: int, verbose: bool, use_adaptive: bool, 
+        rtol: float, atol: float) -> None:
+        '''
+        Body of run(), see run() for the arguments. 
         ''' 
+        if use_adaptive: 
+            start_time = time.time()
+            if verbose: 
+                print(f'Running adaptive dynamic FBA for {n_steps * self.dt_hr:.4f} hours.')
+            self._run_adaptive(n_steps, rtol, atol)
+            if verbose: 
+                cur_time = time.time()
+                print(f'Final Biomass: {self.biomass:.4f} gDW.')
+                print(f'Dynamic FBA simulation completed in {cur_time - start_time:.2f} seconds ({self.n_lp_solves} LP solves).')
+            return 
+
+        # Run in blocks, printing between blocks, so the inner loop only steps. 
         # If verbose, then print every 10% of the steps. 
-        print_every = int(n_steps / 10)
+        block_size = max(n_steps // 10, 1) if verbose else max(n_steps, 1)
         start_time = time.time()
+        self._reserve_timeseries(math.ceil(n_steps / self._record_every))
 
         if verbose: 
             print(f'Running dynamic FBA for {n_steps} steps with dt={self.dt}.')
-        for timestep in range(n_steps): 
-            if self.solution_feasible: 
-                mu, biomass_inhibition_product_term = self.step(timestep)
-                if verbose and timestep % print_every == 0: 
-                    num_seconds_simulated = timestep * self.dt
-                    num_hours_simulated = num_seconds_simulated / 3600.0
-                    print(f'{num_hours_simulated:.4f} hours simulated.')
-                    print(f'Biomass: {self.biomass:.4f} gDW.')
-            else: 
+        for block_start in range(0, n_steps, block_size): 
+            block_end = min(block_start + block_size, n_steps)
+            for timestep in range(block_start, block_end): 
+                if not self.solution_feasible: 
+                    break 
+                self.step(timestep)
+            if not self.solution_feasible: 
                 # Halt simulation when infeasible 
                 break 
+            if verbose: 
+                num_seconds_simulated = block_end * self.dt
+                num_hours_simulated = num_seconds_simulated / 3600.0
+                print(f'{num_hours_simulated:.4f} hours simulated.')
+                print(f'Biomass: {self.biomass:.4f} gDW.')
         if verbose: 
             cur_time = time.time()
             print(f'Final Biomass: {self.biomass:.4f} gDW.')
@@ -11,23 +11,13 @@ def save_results_to_csv(simulator, filepath: str) -> None:
     Save the time series results stored in a DynamicFBASimulator instance
     into a CSV file. The CSV will have a header with column names.
     """
-    # Build header (first column is time, then biomass, then metabolites)
-    fieldnames = ['time_s', 'biomass_gDW'] + list(simulator.ext_conc.keys())
+    # Header: first column is time, then biomass, then metabolites
+    fieldnames = simulator.results_columns
 
     with open(filepath, mode='w', newline='') as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(fieldnames)
-
-        # Number of time points
-        n_steps = len(simulator.results['time_s'])
-
-        for i in range(n_steps):
-            row = [
-                simulator.results['time_s'][i],
-                simulator.results['biomass_gDW'][i],
-                *[simulator.results[m][i] for m in simulator.ext_conc.keys()]
-            ]
-            writer.writerow(row)
+        writer.writerows(simulator.results_array.tolist())
 
     print(f"Results saved to {filepath}")
 
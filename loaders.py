@@ -1,9 +1,10 @@
 import json
+from typing import List
+import numpy as np
+from joblib import Parallel, delayed
 from DynamicFBASimulator import DynamicFBASimulator
 
-def load_simulator_from_json(json_path: str, model_name: str = 'textbook'):
-    with open(json_path, 'r') as f:
-        cfg = json.load(f)
+def load_simulator_from_config(cfg: dict, model_name: str = 'textbook'):
     return DynamicFBASimulator(
         model_name=cfg.get("model_name", model_name),
         dt=cfg.get("dt", 0.01),
@@ -13,5 +14,29 @@ def load_simulator_from_json(json_path: str, model_name: str = 'textbook'):
         vmax_params=cfg.get("vmax_params", {}),
         km_params=cfg.get("km_params", {}),
         kn_params=cfg.get("kn_params", {}),
-        setpoints=cfg.get("setpoints", {})
+        setpoints=cfg.get("setpoints", {}),
+        record_every=cfg.get("record_every", 1),
+        lp_skip_tol=cfg.get("lp_skip_tol", 0.0),
+        bound_eps=cfg.get("bound_eps", 0.0),
+        solver=cfg.get("solver", "auto"),
+        cache_model=cfg.get("cache_model", True)
+    )
+
+def load_simulator_from_json(json_path: str, model_name: str = 'textbook'):
+    with open(json_path, 'r') as f:
+        cfg = json.load(f)
+    return load_simulator_from_config(cfg, model_name)
+
+def _run_one(cfg: dict, n_steps: int) -> np.ndarray:
+    sim = load_simulator_from_config(cfg)
+    sim.run(n_steps=n_steps)
+    return sim.results_array
+
+def run_sweep(configs: List[dict], n_steps: int, n_jobs: int = -1) -> List[np.ndarray]:
+    '''
+    Run one independent simulation per config (same format as the JSON configs)
+    in parallel worker processes. Returns each run's results_array, in config order.
+    '''
+    return Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(_run_one)(cfg, n_steps) for cfg in configs
     )